@@ -1,26 +1,38 @@
 """CLAUDE.md detection and handling."""
 
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=128)
 def detect_claude_md(repo_path: Path) -> Optional[Path]:
     """
     Detect if CLAUDE.md or Agents.md exists in the repository.
     
+    Results are cached per repo_path; call detect_claude_md.cache_clear()
+    if the files may have been added or removed since the last check.
+    
     Args:
         repo_path: Path to the repository root
         
     Returns:
         Path to CLAUDE.md if found, None otherwise
     """
-    claude_md_path = repo_path / "CLAUDE.md"
-    if claude_md_path.exists():
-        return claude_md_path
+    try:
+        with os.scandir(repo_path) as entries:
+            names = {entry.name for entry in entries if not entry.is_dir()}
+    except OSError:
+        names = None
     
-    agents_md_path = repo_path / "Agents.md"
-    if agents_md_path.exists():
-        return agents_md_path
+    for filename in ("CLAUDE.md", "Agents.md"):
+        candidate = repo_path / filename
+        if names is None:
+            if candidate.exists():
+                return candidate
+        elif filename in names:
+            return candidate
     
     return None
 
@@ -1,15 +1,110 @@
 """Claude Code CLI integration."""
 
+import functools
 import json
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+from codebot.core.git_ops import GitOps
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.utils import get_codebot_git_author_info, get_git_env
 from codebot.server.log_capture import LogCapture
 
 
+_BASE_SYSTEM_PROMPT = (
+    "You are a senior engineer that has been tasked to work on this task. You should do the following:\n\n"
+    "1. **Read and understand the task description**\n"
+    "   - Carefully analyze the requirements and scope\n"
+    "   - Identify any potential challenges or dependencies\n"
+    "   - Clarify any ambiguities in the task description\n\n"
+    "2. **Come up with a plan**\n"
+    "   - Break down the task into logical steps\n"
+    "   - Consider the impact on existing code and tests\n"
+    "   - Plan your approach before starting implementation\n\n"
+    "3. **Implement your plan**\n"
+    "   - Write clean, maintainable code following best practices\n"
+    "   - Follow the project's coding standards and conventions\n"
+    "   - Make incremental changes and test as you go\n\n"
+    "4. **Write tests and run them to verify your changes work fine**\n"
+    "   - Write comprehensive tests for new functionality\n"
+    "   - Update existing tests if needed\n"
+    "   - Ensure all tests pass before proceeding\n\n"
+    "5. **Run all tests in the codebase to ensure you have not broken previous functionality**\n"
+    "   - Execute the full test suite to verify no regressions\n"
+    "   - Fix any issues that arise from your changes\n"
+    "   - Ensure the codebase remains stable\n\n"
+    "6. **Commit your changes with a very clear commit message highlighting the changes you made**\n"
+    "   - Write descriptive commit messages that explain what was changed and why\n"
+    "   - Use conventional commit format when appropriate\n"
+    "   - Include relevant details about the implementation approach\n"
+    "   - **CRITICAL: DO NOT include any of the following in your commit messages:**\n"
+    "     * \"🤖 Generated with Claude Code\" or any variation of this text\n"
+    "     * \"Co-Authored-By:\" trailers or any author attribution lines\n"
+    "     * Any text that mentions Claude Code or Claude as an author\n"
+    "**Important Guidelines:**\n"
+    "- Always prioritize code quality and maintainability\n"
+    "- Follow the project's existing patterns and conventions\n"
+    "- Consider edge cases and error handling\n"
+    "- Document complex logic with clear comments\n"
+    "- Ensure your changes are backward compatible when possible\n"
+    "- Complete the task fully before finishing - do not leave incomplete work\n"
+    "- **NEVER add \"🤖 Generated with Claude Code\" or \"Co-Authored-By:\" to commit messages**"
+)
+
+# Invariant flags for every headless Claude Code CLI invocation
+_CLAUDE_FLAGS = (
+    "--output-format", "stream-json",
+    "--verbose",
+    "--dangerously-skip-permissions",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _claude_path() -> str:
+    """
+    Resolve the Claude Code CLI executable once per process.
+    
+    Returns:
+        Absolute path to the claude executable
+        
+    Raises:
+        RuntimeError: If the claude executable is not on PATH
+    """
+    path = shutil.which("claude")
+    if path is None:
+        raise RuntimeError(
+            "Claude Code CLI is not installed. "
+            "Please install it from https://www.anthropic.com/claude/docs/claude-code"
+        )
+    return path
+
+
+def _parse_result_record(line: str) -> Optional[dict]:
+    """
+    Parse a stream-json line if it is Claude's final result record.
+    
+    Args:
+        line: A single line of stream-json output
+        
+    Returns:
+        The decoded record, or None if the line is not a result record
+    """
+    line = line.strip()
+    if '"result"' not in line:
+        return None
+    
+    try:
+        data = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    
+    if isinstance(data, dict) and data.get("type") == "result" and "result" in data:
+        return data
+    return None
+
+
 class ClaudeRunner:
     """Runner for Claude Code CLI in headless mode."""
     
@@ -31,20 +126,25 @@ class ClaudeRunner:
         self.github_app_auth = github_app_auth
         self.log_capture = log_capture
         self._check_claude_installed()
+        
+        # Bot identity is stable for the runner's lifetime; resolving it may
+        # hit the GitHub API, so do it once here
+        self._bot_user_id: Optional[str] = None
+        self._bot_name: Optional[str] = None
+        self._api_url: Optional[str] = None
+        if github_app_auth:
+            self._bot_user_id = github_app_auth.bot_user_id
+            self._bot_name = github_app_auth.get_bot_login()
+            self._api_url = github_app_auth.api_url
+        
+        bot_user_id = self._bot_user_id
+        if github_app_auth and not bot_user_id:
+            bot_user_id = github_app_auth.app_id
+        self._git_env = get_git_env(bot_user_id=bot_user_id, bot_name=self._bot_name, api_url=self._api_url)
     
     def _check_claude_installed(self) -> None:
         """Check if Claude Code CLI is installed."""
-        result = subprocess.run(
-            ["which", "claude"],
-            capture_output=True,
-            text=True,
-        )
-        
-        if result.returncode != 0:
-            raise RuntimeError(
-                "Claude Code CLI is not installed. "
-                "Please install it from https://www.anthropic.com/claude/docs/claude-code"
-            )
+        _claude_path()
     
     def run_task(
         self,
@@ -59,60 +159,22 @@ class ClaudeRunner:
             append_system_prompt: Optional additional system prompt instructions
             
         Returns:
-            CompletedProcess with the command result
+            CompletedProcess with the command result. Output is streamed to
+            stdout as it arrives; only the final stream-json result record
+            is kept in the returned stdout.
         """
-        system_prompt = (
-            "You are a senior engineer that has been tasked to work on this task. You should do the following:\n\n"
-            "1. **Read and understand the task description**\n"
-            "   - Carefully analyze the requirements and scope\n"
-            "   - Identify any potential challenges or dependencies\n"
-            "   - Clarify any ambiguities in the task description\n\n"
-            "2. **Come up with a plan**\n"
-            "   - Break down the task into logical steps\n"
-            "   - Consider the impact on existing code and tests\n"
-            "   - Plan your approach before starting implementation\n\n"
-            "3. **Implement your plan**\n"
-            "   - Write clean, maintainable code following best practices\n"
-            "   - Follow the project's coding standards and conventions\n"
-            "   - Make incremental changes and test as you go\n\n"
-            "4. **Write tests and run them to verify your changes work fine**\n"
-            "   - Write comprehensive tests for new functionality\n"
-            "   - Update existing tests if needed\n"
-            "   - Ensure all tests pass before proceeding\n\n"
-            "5. **Run all tests in the codebase to ensure you have not broken previous functionality**\n"
-            "   - Execute the full test suite to verify no regressions\n"
-            "   - Fix any issues that arise from your changes\n"
-            "   - Ensure the codebase remains stable\n\n"
-            "6. **Commit your changes with a very clear commit message highlighting the changes you made**\n"
-            "   - Write descriptive commit messages that explain what was changed and why\n"
-            "   - Use conventional commit format when appropriate\n"
-            "   - Include relevant details about the implementation approach\n"
-            "   - **CRITICAL: DO NOT include any of the following in your commit messages:**\n"
-            "     * \"🤖 Generated with Claude Code\" or any variation of this text\n"
-            "     * \"Co-Authored-By:\" trailers or any author attribution lines\n"
-            "     * Any text that mentions Claude Code or Claude as an author\n"
-            "**Important Guidelines:**\n"
-            "- Always prioritize code quality and maintainability\n"
-            "- Follow the project's existing patterns and conventions\n"
-            "- Consider edge cases and error handling\n"
-            "- Document complex logic with clear comments\n"
-            "- Ensure your changes are backward compatible when possible\n"
-            "- Complete the task fully before finishing - do not leave incomplete work\n"
-            "- **NEVER add \"🤖 Generated with Claude Code\" or \"Co-Authored-By:\" to commit messages**"
-        )
         
+        system_prompt = _BASE_SYSTEM_PROMPT
         if append_system_prompt:
-            system_prompt += f"\n\nAdditional instructions:\n{append_system_prompt}"
+            system_prompt = f"{_BASE_SYSTEM_PROMPT}\n\nAdditional instructions:\n{append_system_prompt}"
         
         full_prompt = f"Task: {description}"
         
         cmd = [
-            "claude",
+            _claude_path(),
             "-p", full_prompt,
             "--append-system-prompt", system_prompt,
-            "--output-format", "stream-json",
-            "--verbose",
-            "--dangerously-skip-permissions",
+            *_CLAUDE_FLAGS,
         ]
         
         self._configure_git_author()
@@ -123,54 +185,50 @@ class ClaudeRunner:
         
         git_env = self._get_git_env()
         
-        if self.log_capture:
-            process = subprocess.Popen(
-                cmd,
-                cwd=self.work_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                env=git_env,
-                bufsize=1,
-            )
-            
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    line = output.rstrip('\n\r')
-                    if line:
-                        print(line)
-                        if self.log_capture:
-                            self.log_capture.write(line)
-            
-            return_code = process.poll()
-            result = subprocess.CompletedProcess(
-                cmd,
-                return_code,
-                stdout="",
-                stderr="",
-            )
-        else:
-            result = subprocess.run(
-                cmd,
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=git_env,
-            )
-            print(result.stdout)
+        process = subprocess.Popen(
+            cmd,
+            cwd=self.work_dir,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            env=git_env,
+            bufsize=1,
+        )
+        
+        result_record = ""
+        for output in process.stdout:
+            line = output.rstrip('\n\r')
+            if not line:
+                continue
+            print(line)
+            if self.log_capture:
+                self.log_capture.write(line)
+            if _parse_result_record(line) is not None:
+                result_record = line
+        
+        return_code = process.wait()
+        result = subprocess.CompletedProcess(
+            cmd,
+            return_code,
+            stdout=result_record,
+            stderr="",
+        )
         
         print("=" * 80)
         return result
     
     def _configure_git_author(self) -> None:
-        """Configure git author and committer information for codebot."""
+        """
+        Configure git author and committer information for codebot.
+        
+        The identity reaches Claude Code CLI through the GIT_AUTHOR_* and
+        GIT_COMMITTER_* variables in the environment from _get_git_env, so
+        nothing needs to be written to the repository's git config.
+        """
         if not self.github_app_auth or not self.work_dir:
             return
         
-        bot_user_id = self.github_app_auth.bot_user_id
+        bot_user_id = self._bot_user_id
         if not bot_user_id:
             app_id = self.github_app_auth.app_id
             if app_id:
@@ -179,69 +237,36 @@ class ClaudeRunner:
             else:
                 return
         
-        bot_name = self.github_app_auth.get_bot_login()
-        api_url = self.github_app_auth.api_url
-        author_info = get_codebot_git_author_info(bot_user_id, bot_name, api_url)
-        env = get_git_env(bot_user_id=bot_user_id, bot_name=bot_name, api_url=api_url)
-        
-        result = subprocess.run(
-            ["git", "config", "user.name", author_info["author_name"]],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.name: {result.stderr}")
-        
-        result = subprocess.run(
-            ["git", "config", "user.email", author_info["author_email"]],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.email: {result.stderr}")
-        else:
-            print(f"Configured git author for Claude Code CLI: {author_info['author_name']} <{author_info['author_email']}>")
+        author_info = get_codebot_git_author_info(bot_user_id, self._bot_name, self._api_url)
+        print(f"Configured git author for Claude Code CLI: {author_info['author_name']} <{author_info['author_email']}>")
     
     def _get_git_env(self) -> dict:
-        bot_user_id = None
-        bot_name = None
-        api_url = None
-        if self.github_app_auth:
-            bot_user_id = self.github_app_auth.bot_user_id
-            bot_name = self.github_app_auth.get_bot_login()
-            api_url = self.github_app_auth.api_url
-            if not bot_user_id:
-                bot_user_id = self.github_app_auth.app_id
-        return get_git_env(bot_user_id=bot_user_id, bot_name=bot_name, api_url=api_url)
+        return self._git_env
     
     def verify_changes_committed(self) -> bool:
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-        )
+        """
+        Check that the working tree has no uncommitted changes.
+        
+        Kept for existing callers; new code should use GitOps.has_uncommitted_changes.
         
-        return result.stdout.strip() == ""
+        Returns:
+            True if everything is committed, False otherwise
+        """
+        return not GitOps(self.work_dir, self.github_app_auth).has_uncommitted_changes()
     
     def get_commit_message(self) -> Optional[str]:
-        result = subprocess.run(
-            ["git", "log", "-1", "--pretty=%B"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-        )
+        """
+        Get the message of the latest commit.
         
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
+        Kept for existing callers; new code should use GitOps.get_commit_message.
         
-        return None
+        Returns:
+            Commit message, or None if there is no commit
+        """
+        try:
+            return GitOps(self.work_dir, self.github_app_auth).get_commit_message("HEAD") or None
+        except RuntimeError:
+            return None
     
     def extract_claude_response(self, result: subprocess.CompletedProcess) -> Optional[str]:
         """
@@ -256,18 +281,10 @@ class ClaudeRunner:
         if result.returncode != 0 or not result.stdout:
             return None
         
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            
-            try:
-                data = json.loads(line)
-                
-                if data.get("type") == "result" and "result" in data:
-                    return data["result"]
-                    
-            except json.JSONDecodeError:
-                continue
+        # The result record is emitted last, so scan backwards.
+        for line in reversed(result.stdout.splitlines()):
+            data = _parse_result_record(line)
+            if data is not None:
+                return data["result"]
         
         return None
@@ -1,7 +1,6 @@
 """CLI interface for codebot."""
 
 import click
-from dotenv import load_dotenv
 
 from codebot.cli_runner.runner import run
 from codebot.server.app import serve
@@ -10,7 +9,9 @@ from codebot.server.app import serve
 @click.group()
 def cli():
     """Codebot CLI - AI-assisted development task automation."""
-    load_dotenv()
+    from codebot.core.utils import load_env
+    
+    load_env()
 
 
 # Register commands
@@ -3,18 +3,85 @@
 import os
 import sys
 import uuid
-from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from dotenv import load_dotenv
 
-from codebot.core.github_app import GitHubAppAuth
-from codebot.core.models import Task
-from codebot.core.orchestrator import Orchestrator
-from codebot.core.parser import parse_task_prompt, parse_task_prompt_file
-from codebot.core.task_store import global_task_store
-from codebot.core.utils import validate_github_app_config
+if TYPE_CHECKING:
+    from codebot.core.github_app import GitHubAppAuth
+    from codebot.core.models import TaskPrompt
+
+
+def _execute_task(task: "TaskPrompt", work_base_dir: Path, github_app_auth: "GitHubAppAuth") -> bool:
+    """
+    Run a single task through the orchestrator and record it in the task store.
+    
+    Args:
+        task: Task prompt to execute
+        work_base_dir: Base directory for work spaces
+        github_app_auth: GitHub App authentication instance
+        
+    Returns:
+        True if the task produced a pull request, False if it failed
+    """
+    from codebot.core.models import Task
+    from codebot.core.orchestrator import Orchestrator
+    from codebot.core.task_store import global_task_store
+    from codebot.core.utils import utc_now
+    
+    # CLI tasks start immediately, so record them as running in a single write
+    task_id = str(uuid.uuid4())
+    now = utc_now()
+    task_obj = Task(
+        id=task_id,
+        prompt=task,
+        status="running",
+        submitted_at=now,
+        source="cli",
+        started_at=now,
+    )
+    global_task_store.add_task(task_obj)
+    
+    # Create and run orchestrator
+    try:
+        orchestrator = Orchestrator(
+            task=task,
+            work_base_dir=work_base_dir,
+            github_app_auth=github_app_auth,
+        )
+        orchestrator.run()
+        
+        result = {
+            "pr_url": orchestrator.pr_url,
+            "branch_name": orchestrator.branch_name,
+            "work_dir": str(orchestrator.work_dir) if orchestrator.work_dir else None,
+        }
+        global_task_store.update_task(
+            task_id,
+            status="pending_review",
+            completed_at=None,
+            result=result,
+        )
+        return True
+        
+    except KeyboardInterrupt:
+        global_task_store.update_task(
+            task_id,
+            status="failed",
+            completed_at=utc_now(),
+            error="Interrupted by user",
+        )
+        raise
+    except Exception as e:
+        click.echo(f"\nError: {e}", err=True)
+        global_task_store.update_task(
+            task_id,
+            status="failed",
+            completed_at=utc_now(),
+            error=str(e),
+        )
+        return False
 
 
 @click.command(name="run")
@@ -26,7 +93,8 @@ from codebot.core.utils import validate_github_app_config
 @click.option(
     "--task-prompt-file",
     type=click.Path(exists=True),
-    help="Path to task prompt file (JSON or YAML)",
+    multiple=True,
+    help="Path to task prompt file (JSON or YAML). Repeat to run several tasks in parallel",
 )
 @click.option(
     "--work-dir",
@@ -34,6 +102,12 @@ from codebot.core.utils import validate_github_app_config
     default=None,
     help="Base directory for work spaces (defaults to ./codebot_workspace)",
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of tasks to run concurrently (defaults to the number of CPUs)",
+)
 @click.option(
     "--verbose",
     is_flag=True,
@@ -41,8 +115,9 @@ from codebot.core.utils import validate_github_app_config
 )
 def run(
     task_prompt: str,
-    task_prompt_file: str,
+    task_prompt_file: tuple,
     work_dir: str,
+    max_workers: int,
     verbose: bool,
 ) -> None:
     """
@@ -54,6 +129,10 @@ def run(
     Example:
         codebot --task-prompt-file task.yaml
     
+    Several independent tasks can be run in parallel, each in its own
+    workspace:
+        codebot --task-prompt-file a.yaml --task-prompt-file b.yaml
+    
     Example task prompt (YAML):
         repository_url: https://github.com/user/repo.git
         ticket_id: PROJ-123
@@ -62,13 +141,19 @@ def run(
           Fix the login authentication bug.
           Ensure all tests pass.
     """
-    load_dotenv()
+    from codebot.core.parser import parse_task_prompt, parse_task_prompt_file
+    from codebot.core.utils import load_env
+    
+    env = load_env()
+    
+    if task_prompt and task_prompt_file:
+        raise click.UsageError("--task-prompt and --task-prompt-file cannot be used together")
     
     try:
         if task_prompt:
-            task = parse_task_prompt(task_prompt)
+            tasks = [parse_task_prompt(task_prompt)]
         elif task_prompt_file:
-            task = parse_task_prompt_file(task_prompt_file)
+            tasks = [parse_task_prompt_file(path) for path in task_prompt_file]
         else:
             click.echo("Error: Either --task-prompt or --task-prompt-file must be provided", err=True)
             sys.exit(1)
@@ -83,20 +168,31 @@ def run(
     
     work_base_dir.mkdir(parents=True, exist_ok=True)
     
+    # Import here so that --help and invalid arguments do not load the
+    # orchestrator, the GitHub App crypto stack, or the task database
+    from codebot.core.github_app import GitHubAppAuth
+    from codebot.core.utils import validate_github_app_config
+    
     print("Validating GitHub App configuration...")
     if verbose:
         print("Debug information:")
-        github_api_url = os.getenv("GITHUB_API_URL")
-        github_enterprise_url = os.getenv("GITHUB_ENTERPRISE_URL")
+        github_api_url = env.get("GITHUB_API_URL")
+        github_enterprise_url = env.get("GITHUB_ENTERPRISE_URL")
         if github_api_url:
             print(f"  → GITHUB_API_URL: {github_api_url}")
         if github_enterprise_url:
             print(f"  → GITHUB_ENTERPRISE_URL: {github_enterprise_url}")
         if not github_api_url and not github_enterprise_url:
             print("  → No GitHub Enterprise environment variables set, using github.com")
-        print(f"  → Repository URL from task: {task.repository_url}")
     
-    is_valid, error_type = validate_github_app_config(repository_url=task.repository_url, verbose=verbose)
+    # Tasks for the same repository share an API URL, so validate each repository once
+    for repository_url in dict.fromkeys(task.repository_url for task in tasks):
+        if verbose:
+            print(f"  → Repository URL from task: {repository_url}")
+        is_valid, error_type = validate_github_app_config(repository_url=repository_url, verbose=verbose)
+        if not is_valid:
+            break
+    
     if not is_valid:
         if error_type == "config_missing":
             click.echo("Error: GitHub App configuration not found. Please set the required environment variables.", err=True)
@@ -126,55 +222,32 @@ def run(
     
     github_app_auth = GitHubAppAuth()
     
-    task_id = str(uuid.uuid4())
-    task_obj = Task(
-        id=task_id,
-        prompt=task,
-        status="pending",
-        submitted_at=datetime.utcnow(),
-        source="cli",
-    )
-    global_task_store.add_task(task_obj)
-    
-    # Create and run orchestrator
     try:
-        global_task_store.update_task(task_id, status="running", started_at=datetime.utcnow())
-        
-        orchestrator = Orchestrator(
-            task=task,
-            work_base_dir=work_base_dir,
-            github_app_auth=github_app_auth,
-        )
-        orchestrator.run()
-        
-        result = {
-            "pr_url": orchestrator.pr_url,
-            "branch_name": orchestrator.branch_name,
-            "work_dir": str(orchestrator.work_dir) if orchestrator.work_dir else None,
-        }
-        global_task_store.update_task(
-            task_id,
-            status="pending_review",
-            completed_at=None,
-            result=result,
-        )
-        
+        if len(tasks) == 1:
+            succeeded = [_execute_task(tasks[0], work_base_dir, github_app_auth)]
+        else:
+            # Each task is bound by Claude and git subprocesses in its own
+            # workspace, so threads are enough to run them concurrently
+            from concurrent.futures import ThreadPoolExecutor
+            
+            workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+            print(f"Running {len(tasks)} tasks with {workers} worker(s)...")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                try:
+                    succeeded = list(executor.map(
+                        lambda task: _execute_task(task, work_base_dir, github_app_auth),
+                        tasks,
+                    ))
+                except KeyboardInterrupt:
+                    # Drop tasks that have not started instead of running them all before exiting.
+                    # Running tasks get the same SIGINT through their Claude and git subprocesses.
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
     except KeyboardInterrupt:
         click.echo("\n\nInterrupted by user", err=True)
-        global_task_store.update_task(
-            task_id,
-            status="failed",
-            completed_at=datetime.utcnow(),
-            error="Interrupted by user",
-        )
         sys.exit(1)
-    except Exception as e:
-        click.echo(f"\nError: {e}", err=True)
-        global_task_store.update_task(
-            task_id,
-            status="failed",
-            completed_at=datetime.utcnow(),
-            error=str(e),
-        )
+    
+    if not all(succeeded):
+        if len(tasks) > 1:
+            click.echo(f"\n{succeeded.count(False)} of {len(tasks)} tasks failed", err=True)
         sys.exit(1)
-
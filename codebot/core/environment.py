@@ -48,16 +48,19 @@ class EnvironmentManager:
         
         print(f"Created work directory: {self.work_dir}")
         
-        GitOps.clone_repository(self.task.repository_url, self.work_dir, self.github_app_auth)
+        # Clone straight onto the base branch; without one, the clone checks out the default branch
+        GitOps.clone_repository(
+            self.task.repository_url,
+            self.work_dir,
+            self.github_app_auth,
+            branch=self.task.base_branch,
+        )
         
         self.git_ops.configure_git_author()
         
         self.default_branch = self.git_ops.detect_default_branch()
         print(f"Detected default branch: {self.default_branch}")
         
-        base_branch = self.task.base_branch or self.default_branch
-        self.git_ops.checkout_branch(base_branch)
-        
         self.branch_name = generate_branch_name(
             ticket_id=self.task.ticket_id,
             short_name=self.task.ticket_summary,
@@ -109,13 +112,12 @@ class EnvironmentManager:
         if not self.work_dir:
             return
         
-        if not self.git_ops.fetch_from_remote():
+        # Fetch only the PR branch and move onto it, instead of fetching everything and pulling
+        if not self.git_ops.fetch_from_remote(self.branch_name):
             return
         
         print(f"Checking out branch: {self.branch_name}")
-        self.git_ops.checkout_branch(self.branch_name)
-        
-        self.git_ops.pull_latest_changes(self.branch_name)
+        self.git_ops.checkout_fetched_branch(self.branch_name)
         
         print("Workspace updated successfully")
     
@@ -1,12 +1,57 @@
 """Git operations for committing and pushing changes."""
 
+import functools
+import re
 import subprocess
+import time
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
 
 from codebot.core.github_app import GitHubAppAuth
-from codebot.core.utils import get_codebot_git_author_info, get_git_env, is_github_url
+from codebot.core.utils import (
+    backoff_delay,
+    get_codebot_git_author_info,
+    get_git_env,
+    get_git_executable,
+    is_github_url,
+)
+
+_CLONE_MAX_ATTEMPTS = 3
+
+# Environment variable the credential helper reads the installation token from
+_TOKEN_ENV_VAR = "CODEBOT_GIT_TOKEN"
+_CREDENTIAL_HELPER = (
+    '!f() { test "$1" = get && printf "username=x-access-token\\npassword=%s\\n" "$CODEBOT_GIT_TOKEN"; }; f'
+)
+
+# Clone failure kinds, matched in a single pass over git's stderr
+_CLONE_ERROR_RE = re.compile(
+    r"(?P<branch>remote branch)"
+    r"|(?P<auth>authentication failed|\b401\b)"
+    r"|(?P<not_found>not found|\b404\b)"
+    r"|(?P<transient>could not resolve host|connection timed out|connection reset|early eof"
+    r"|the remote end hung up unexpectedly|returned error: (?:429|50[0234])\b)",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _split_remote_url(repository_url: str) -> Tuple[str, str]:
+    """
+    Split a repository URL into its host and a path ending in .git.
+    
+    Args:
+        repository_url: Repository URL
+        
+    Returns:
+        Tuple of (netloc, path). netloc is empty if the URL has no host.
+    """
+    parsed = urlparse(repository_url)
+    path = parsed.path
+    if not path.endswith(".git"):
+        path += ".git"
+    return parsed.netloc, path
 
 
 class GitOps:
@@ -22,8 +67,18 @@ class GitOps:
         """
         self.work_dir = work_dir
         self.github_app_auth = github_app_auth
+        self._git_env: Optional[dict] = None
+        self._remote_url: Optional[str] = None
+        # Resolved git binary run against the workspace with -C instead of a cwd change
+        self._git = [get_git_executable(), "-C", str(work_dir)]
     
     def _get_git_env(self) -> dict:
+        # Resolving the bot identity may call the GitHub API, so build the env once per instance
+        if self._git_env is None:
+            self._git_env = self._build_git_env()
+        return self._git_env
+    
+    def _build_git_env(self) -> dict:
         bot_user_id = None
         bot_name = None
         api_url = None
@@ -35,57 +90,53 @@ class GitOps:
                 bot_user_id = self.github_app_auth.app_id
         return get_git_env(bot_user_id=bot_user_id, bot_name=bot_name, api_url=api_url)
     
-    def _create_authenticated_url(self, repository_url: str) -> str:
+    def _get_auth_config(self, repository_url: str) -> Tuple[List[str], Dict[str, str]]:
         """
-        Create authenticated URL for GitHub repository.
+        Build git config arguments and environment that authenticate requests to a GitHub remote.
+        
+        A credential helper scoped to the remote's host is passed via -c and reads
+        the token from the environment, so the token only applies to that one git
+        command, never appears in argv or URLs, and .git/config never changes.
         
         Args:
-            repository_url: Original repository URL
+            repository_url: Remote URL the command will talk to
             
         Returns:
-            Authenticated URL with embedded token
+            Tuple of (git arguments to place before the subcommand, extra environment
+            variables for the command). Both are empty if no authentication is needed.
         """
         if not self.github_app_auth or not is_github_url(repository_url):
-            return repository_url
-        
-        parsed = urlparse(repository_url)
-        if not parsed.netloc:
-            return repository_url
+            return [], {}
+        if self._is_authenticated_url(repository_url):
+            return [], {}
         
-        path = parsed.path
-        if not path.endswith(".git"):
-            path += ".git"
+        netloc, _ = _split_remote_url(repository_url)
+        if not netloc:
+            return [], {}
         
         token = self.github_app_auth.get_installation_token()
-        auth_url = f"https://oauth2:{token}@{parsed.netloc}{path}"
-        return auth_url
+        # The empty helper first drops any helpers configured for the host
+        config = [
+            "-c", f"credential.https://{netloc}.helper=",
+            "-c", f"credential.https://{netloc}.helper={_CREDENTIAL_HELPER}",
+        ]
+        return config, {_TOKEN_ENV_VAR: token}
     
     def _get_remote_url(self) -> Optional[str]:
-        env = self._get_git_env()
-        result = subprocess.run(
-            ["git", "remote", "get-url", "origin"],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
+        # GitOps never rewrites origin, so its URL can be looked up once per instance
+        if self._remote_url is not None:
+            return self._remote_url
         
-        if result.returncode == 0:
-            return result.stdout.strip()
-        return None
-    
-    def _set_remote_url(self, url: str) -> None:
         env = self._get_git_env()
         result = subprocess.run(
-            ["git", "remote", "set-url", "origin", url],
-            cwd=self.work_dir,
+            [*self._git, "remote", "get-url", "origin"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
-        if result.returncode != 0:
-            raise RuntimeError(f"Failed to set remote URL: {result.stderr}")
+        if result.returncode == 0:
+            self._remote_url = result.stdout.strip().decode()
+        return self._remote_url
     
     def commit_changes(self, message: str) -> None:
         """
@@ -97,26 +148,22 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "add", "-A"],
-            cwd=self.work_dir,
+            [*self._git, "add", "-A"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to stage changes: {result.stderr}")
+            raise RuntimeError(f"Failed to stage changes: {result.stderr.decode(errors='replace')}")
         
         result = subprocess.run(
-            ["git", "commit", "-m", message],
-            cwd=self.work_dir,
+            [*self._git, "commit", "-m", message],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode != 0:
-            raise RuntimeError(f"Failed to commit: {result.stderr}")
+            raise RuntimeError(f"Failed to commit: {result.stderr.decode(errors='replace')}")
         
         print(f"Committed changes: {message}")
     
@@ -129,33 +176,23 @@ class GitOps:
         """
         env = self._get_git_env()
         
-        original_url = None
+        auth_config = []
         if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url:
-                auth_url = self._create_authenticated_url(original_url)
-                if auth_url != original_url:
-                    print("Setting up authenticated remote for push...")
-                    self._set_remote_url(auth_url)
+            remote_url = self._get_remote_url()
+            if remote_url:
+                auth_config, auth_env = self._get_auth_config(remote_url)
+                env = {**env, **auth_env}
         
-        try:
-            result = subprocess.run(
-                ["git", "push", "-u", "origin", branch_name],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            
-            if result.returncode != 0:
-                raise RuntimeError(f"Failed to push branch: {result.stderr}")
-            
-            print(f"Pushed branch {branch_name} to remote")
-            
-        finally:
-            if original_url and self.github_app_auth:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
+        result = subprocess.run(
+            [*self._git, *auth_config, "push", "-u", "origin", branch_name],
+            capture_output=True,
+            env=env,
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to push branch: {result.stderr.decode(errors='replace')}")
+        
+        print(f"Pushed branch {branch_name} to remote")
     
     def has_uncommitted_changes(self) -> bool:
         """
@@ -166,15 +203,59 @@ class GitOps:
         """
         env = self._get_git_env()
         
+        # Untracked files count as changes, which git diff --quiet would miss.
+        # Only emptiness matters, so skip rename detection and decoding.
         result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=self.work_dir,
+            [*self._git, "status", "--porcelain", "--no-renames"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
-        return result.stdout.strip() != ""
+        return result.stdout.strip() != b""
+    
+    def _read_head(self) -> Optional[Tuple[Optional[str], str]]:
+        """
+        Read the checked-out branch and commit straight from the .git directory.
+        
+        Returns:
+            Tuple of (branch name or None if detached, commit hash), or None if the
+            ref is not a loose or packed ref and git has to resolve it
+        """
+        git_dir = self.work_dir / ".git"
+        try:
+            head = (git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        
+        if not head.startswith("ref: "):
+            return None, head
+        
+        ref = head[len("ref: "):]
+        if not ref.startswith("refs/heads/"):
+            return None
+        branch = ref[len("refs/heads/"):]
+        
+        try:
+            commit = (git_dir / ref).read_text().strip()
+            return (branch, commit) if not commit.startswith("ref: ") else None
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        
+        # Refs that are not loose files live in packed-refs
+        try:
+            with open(git_dir / "packed-refs") as packed_refs:
+                for line in packed_refs:
+                    if line.rstrip("\n").endswith(f" {ref}"):
+                        return branch, line.split(" ", 1)[0]
+        except FileNotFoundError:
+            pass
+        except OSError:
+            return None
+        
+        # Reftable repositories and unborn branches have no ref file to read
+        return None
     
     def get_latest_commit_hash(self) -> Optional[str]:
         """
@@ -183,18 +264,21 @@ class GitOps:
         Returns:
             Commit hash or None if no commits exist
         """
+        # Avoid spawning git for a plain .git directory
+        head = self._read_head()
+        if head is not None:
+            return head[1]
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            cwd=self.work_dir,
+            [*self._git, "rev-parse", "HEAD"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.strip().decode()
         
         return None
     
@@ -205,18 +289,20 @@ class GitOps:
         Returns:
             Branch name or None if no branch is checked out
         """
+        head = self._read_head()
+        if head is not None:
+            return head[0] or "HEAD"
+        
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=self.work_dir,
+            [*self._git, "rev-parse", "--abbrev-ref", "HEAD"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout.strip().decode()
         
         return None
     
@@ -233,8 +319,7 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "log", "-1", "--pretty=%B", commit_hash],
-            cwd=self.work_dir,
+            [*self._git, "log", "-1", "--pretty=%B", commit_hash],
             capture_output=True,
             text=True,
             env=env,
@@ -245,6 +330,33 @@ class GitOps:
         
         return result.stdout.strip()
     
+    def get_commit_summary(self, commit_hash: str = "HEAD") -> Tuple[Optional[str], Optional[str]]:
+        """
+        Get a commit's message and the files it changed with a single git call.
+        
+        Args:
+            commit_hash: Commit to describe (defaults to HEAD)
+            
+        Returns:
+            Tuple of (commit message, name-status list of changed files). Either is
+            None if it could not be read or is empty.
+        """
+        env = self._get_git_env()
+        
+        # The NUL after the message separates it from the --name-status file list
+        result = subprocess.run(
+            [*self._git, "show", "--no-color", "--format=%B%x00", "--name-status", commit_hash],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        
+        if result.returncode != 0:
+            return None, None
+        
+        message, _, files_changed = result.stdout.partition("\0")
+        return message.strip() or None, files_changed.strip() or None
+    
     def remove_co_author_trailers(self) -> None:
         """
         Remove Co-Authored-By trailers and unwanted text from the latest commit.
@@ -255,8 +367,7 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "log", "-1", "--pretty=format:%B"],
-            cwd=self.work_dir,
+            [*self._git, "log", "-1", "--pretty=format:%B"],
             capture_output=True,
             text=True,
             env=env,
@@ -273,11 +384,7 @@ class GitOps:
         has_unwanted = False
         
         for line in lines:
-            stripped = line.strip()
-            if stripped.startswith("Co-Authored-By:"):
-                has_unwanted = True
-                continue
-            if stripped == "🤖 Generated with Claude Code" or "🤖 Generated with Claude Code" in stripped:
+            if line.lstrip().startswith("Co-Authored-By:") or "🤖 Generated with Claude Code" in line:
                 has_unwanted = True
                 continue
             cleaned_lines.append(line)
@@ -286,12 +393,11 @@ class GitOps:
             return
         
         cleaned_message = "\n".join(cleaned_lines).strip()
-        while cleaned_message.endswith("\n\n"):
-            cleaned_message = cleaned_message[:-1]
         
+        # Pipe the message through stdin so long messages never hit argv limits
         result = subprocess.run(
-            ["git", "commit", "--amend", "-m", cleaned_message],
-            cwd=self.work_dir,
+            [*self._git, "commit", "--amend", "-F", "-"],
+            input=cleaned_message,
             capture_output=True,
             text=True,
             env=env,
@@ -304,93 +410,85 @@ class GitOps:
     
     def _is_authenticated_url(self, url: str) -> bool:
         """Check if URL contains authentication token."""
-        return "oauth2:" in url or "@" in url and "token" in url
+        return "oauth2:" in url or urlparse(url).password is not None
     
-    def fetch_from_remote(self) -> bool:
+    def fetch_from_remote(self, branch_name: Optional[str] = None) -> bool:
         """
         Fetch latest changes from remote with proper authentication.
         
+        Args:
+            branch_name: Optional branch to fetch instead of all branches
+            
         Returns:
             True if fetch was successful, False otherwise
         """
         print("Fetching latest changes from remote...")
         
-        original_url = None
+        env = self._get_git_env()
         
+        auth_config = []
         if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url and not self._is_authenticated_url(original_url):
-                auth_url = self._create_authenticated_url(original_url)
-                print("Setting up authenticated remote URL for fetch...")
-                self._set_remote_url(auth_url)
+            remote_url = self._get_remote_url()
+            if remote_url:
+                auth_config, auth_env = self._get_auth_config(remote_url)
+                env = {**env, **auth_env}
         
-        try:
-            env = self._get_git_env()
-            result = subprocess.run(
-                ["git", "fetch", "origin"],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            
-            if result.returncode != 0:
-                print(f"Warning: Failed to fetch from remote: {result.stderr.strip()}")
-                return False
-            
-            print("Successfully fetched from remote")
-            return True
-            
-        finally:
-            if self.github_app_auth and original_url:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
+        fetch_cmd = [*self._git, *auth_config, "fetch", "origin"]
+        if branch_name:
+            fetch_cmd.append(branch_name)
+        
+        result = subprocess.run(
+            fetch_cmd,
+            capture_output=True,
+            env=env,
+        )
+        
+        if result.returncode != 0:
+            print(f"Warning: Failed to fetch from remote: {result.stderr.strip().decode(errors='replace')}")
+            return False
+        
+        print("Successfully fetched from remote")
+        return True
     
-    def pull_latest_changes(self, branch_name: str) -> bool:
+    def checkout_fetched_branch(self, branch_name: str) -> None:
         """
-        Pull latest changes from the specified branch with proper authentication.
+        Checkout a branch reset to the commit fetched by the last fetch_from_remote call.
+        
+        The workspace is made to match the remote branch: uncommitted edits are
+        discarded, and local commits on the branch that were never pushed are
+        dropped from it without warning.
         
         Args:
-            branch_name: Name of the branch to pull from
-            
-        Returns:
-            True if pull was successful, False otherwise
+            branch_name: Name of the branch to checkout
         """
-        print(f"Pulling latest changes from branch: {branch_name}")
-        
-        original_url = None
+        env = self._get_git_env()
         
+        # Workspaces cloned as partial clones fetch missing blobs during checkout, which needs auth
+        auth_config = []
         if self.github_app_auth:
-            original_url = self._get_remote_url()
-            if original_url and not self._is_authenticated_url(original_url):
-                auth_url = self._create_authenticated_url(original_url)
-                print("Setting up authenticated remote URL for pull...")
-                self._set_remote_url(auth_url)
+            remote_url = self._get_remote_url()
+            if remote_url:
+                auth_config, auth_env = self._get_auth_config(remote_url)
+                env = {**env, **auth_env}
         
-        try:
-            env = self._get_git_env()
-            result = subprocess.run(
-                ["git", "pull", "origin", branch_name],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-                env=env,
+        result = subprocess.run(
+            [*self._git, *auth_config, "checkout", "--force", "-B", branch_name, "FETCH_HEAD"],
+            capture_output=True,
+            env=env,
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"Failed to checkout branch {branch_name}: {result.stderr.decode(errors='replace')}"
             )
-            
-            if result.returncode != 0:
-                print(f"Warning: Failed to pull latest changes: {result.stderr.strip()}")
-                return False
-            
-            print("Successfully pulled latest changes")
-            return True
-            
-        finally:
-            if self.github_app_auth and original_url:
-                print("Restoring clean remote URL...")
-                self._set_remote_url(original_url)
     
     @staticmethod
-    def clone_repository(repo_url: str, target_dir: Path, github_app_auth: Optional[GitHubAppAuth] = None) -> None:
+    def clone_repository(
+        repo_url: str,
+        target_dir: Path,
+        github_app_auth: Optional[GitHubAppAuth] = None,
+        branch: Optional[str] = None,
+    ) -> None:
         """
         Clone a repository into the target directory with optional authentication.
         
@@ -398,33 +496,61 @@ class GitOps:
             repo_url: Repository URL to clone
             target_dir: Target directory to clone into
             github_app_auth: Optional GitHub App authentication instance
+            branch: Branch to check out after cloning (defaults to the remote HEAD)
         """
-        auth_repo_url = repo_url
+        clone_url = repo_url
+        auth_config = []
+        auth_env = {}
         
         if github_app_auth and is_github_url(repo_url):
-            temp_git_ops = GitOps(target_dir, github_app_auth)
-            auth_repo_url = temp_git_ops._create_authenticated_url(repo_url)
+            # Clone the clean URL so no credentials end up in the remote config
+            netloc, path = _split_remote_url(repo_url)
+            if netloc:
+                clone_url = urlunparse(("https", netloc, path, "", "", ""))
+            auth_config, auth_env = GitOps(target_dir, github_app_auth)._get_auth_config(clone_url)
             print(f"Cloning repository with authentication")
         else:
             print(f"Cloning repository: {repo_url}")
         
-        env = get_git_env()
+        env = {**get_git_env(), **auth_env}
         
-        result = subprocess.run(
-            ["git", "clone", auth_repo_url, str(target_dir)],
-            capture_output=True,
-            text=True,
-            env=env,
-        )
+        # Check out the requested branch as part of the clone instead of in a separate step.
+        # The clone stays full: a partial clone would fetch missing blobs from origin on demand,
+        # and later git commands (including Claude's own) do not carry the auth config.
+        clone_cmd = [get_git_executable(), *auth_config, "clone", "--no-tags"]
+        if branch:
+            clone_cmd.extend(["--branch", branch])
+        clone_cmd.extend([clone_url, str(target_dir)])
+        
+        # A failed clone leaves the target directory empty, so it can be retried in place
+        for attempt in range(_CLONE_MAX_ATTEMPTS):
+            result = subprocess.run(
+                clone_cmd,
+                capture_output=True,
+                text=True,
+                env=env,
+            )
+            
+            if result.returncode == 0:
+                break
+            
+            error_kinds = {match.lastgroup for match in _CLONE_ERROR_RE.finditer(result.stderr)}
+            if attempt == _CLONE_MAX_ATTEMPTS - 1 or "transient" not in error_kinds:
+                break
+            
+            delay = backoff_delay(attempt)
+            print(f"Warning: Clone failed with a transient error, retrying in {delay:.1f}s...")
+            time.sleep(delay)
         
         if result.returncode != 0:
-            error_msg = result.stderr.lower()
-            if "authentication failed" in error_msg or "401" in error_msg:
+            if branch and "branch" in error_kinds:
+                raise RuntimeError(f"Failed to checkout branch {branch}: {result.stderr}")
+            elif "auth" in error_kinds:
                 raise RuntimeError(
                     f"Authentication failed. Please check your GitHub App configuration and permissions.\n"
                     f"Error: {result.stderr}"
                 )
-            elif "not found" in error_msg or "404" in error_msg:
+            elif "not_found" in error_kinds:
                 raise RuntimeError(
                     f"Repository not found or access denied. Please check the repository URL and GitHub App permissions.\n"
                     f"Error: {result.stderr}"
@@ -432,39 +558,6 @@ class GitOps:
             else:
                 raise RuntimeError(f"Failed to clone repository: {result.stderr}")
         
-        if github_app_auth and is_github_url(repo_url):
-            git_ops = GitOps(target_dir, github_app_auth)
-            git_ops.reset_remote_url(repo_url)
-    
-    def reset_remote_url(self, clean_url: str) -> None:
-        """
-        Reset remote URL to clean format (remove embedded credentials).
-        
-        Args:
-            clean_url: Clean repository URL without credentials
-        """
-        parsed = urlparse(clean_url)
-        
-        path = parsed.path
-        if not path.endswith(".git"):
-            path += ".git"
-        
-        clean_remote_url = f"https://{parsed.netloc}{path}"
-        
-        env = self._get_git_env()
-        result = subprocess.run(
-            ["git", "remote", "set-url", "origin", clean_remote_url],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to reset remote URL: {result.stderr}")
-        else:
-            print(f"Reset remote URL to clean format: {clean_remote_url}")
-    
     def detect_default_branch(self) -> str:
         """
         Detect the default branch of the repository.
@@ -472,34 +565,40 @@ class GitOps:
         Returns:
             Name of the default branch (main or master)
         """
+        # Clone records the remote HEAD as a loose symbolic ref, which can be read without git
+        try:
+            head_ref = (self.work_dir / ".git" / "refs" / "remotes" / "origin" / "HEAD").read_text().strip()
+        except OSError:
+            head_ref = ""
+        if head_ref.startswith("ref: refs/remotes/origin/"):
+            return head_ref[len("ref: refs/remotes/origin/"):]
+        
         env = self._get_git_env()
         
+        # Otherwise ask git, which still needs no network round trip
         result = subprocess.run(
-            ["git", "remote", "show", "origin"],
-            cwd=self.work_dir,
+            [*self._git, "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode == 0:
-            for line in result.stdout.split("\n"):
-                if "HEAD branch:" in line:
-                    return line.split("HEAD branch:")[1].strip()
+            head_ref = result.stdout.strip()
+            if head_ref.startswith(b"origin/"):
+                return head_ref[len(b"origin/"):].decode()
         
+        # List exact branch names so that e.g. origin/maintenance does not match "main"
         result = subprocess.run(
-            ["git", "branch", "-r"],
-            cwd=self.work_dir,
+            [*self._git, "for-each-ref", "--format=%(refname:lstrip=3)", "refs/remotes/origin"],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode == 0:
-            branches = result.stdout
-            if "main" in branches:
+            branches = set(result.stdout.splitlines())
+            if b"main" in branches:
                 return "main"
-            elif "master" in branches:
+            elif b"master" in branches:
                 return "master"
         
         return "main"
@@ -514,16 +613,14 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "checkout", branch_name],
-            cwd=self.work_dir,
+            [*self._git, "checkout", branch_name],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to checkout branch {branch_name}: {result.stderr}"
+                f"Failed to checkout branch {branch_name}: {result.stderr.decode(errors='replace')}"
             )
     
     def create_branch(self, branch_name: str) -> None:
@@ -536,20 +633,24 @@ class GitOps:
         env = self._get_git_env()
         
         result = subprocess.run(
-            ["git", "checkout", "-b", branch_name],
-            cwd=self.work_dir,
+            [*self._git, "checkout", "-b", branch_name],
             capture_output=True,
-            text=True,
             env=env,
         )
         
         if result.returncode != 0:
             raise RuntimeError(
-                f"Failed to create branch {branch_name}: {result.stderr}"
+                f"Failed to create branch {branch_name}: {result.stderr.decode(errors='replace')}"
             )
     
     def configure_git_author(self) -> None:
-        """Configure git author and committer information for codebot."""
+        """
+        Configure git author and committer information for codebot.
+        
+        Git reads the identity from the GIT_AUTHOR_* and GIT_COMMITTER_* variables
+        that _get_git_env passes to every git command, so nothing is written to
+        the repository's git config.
+        """
         if not self.github_app_auth or not self.work_dir:
             return
         
@@ -565,29 +666,4 @@ class GitOps:
         bot_name = self.github_app_auth.get_bot_login()
         api_url = self.github_app_auth.api_url
         author_info = get_codebot_git_author_info(bot_user_id, bot_name, api_url)
-        env = self._get_git_env()
-        
-        result = subprocess.run(
-            ["git", "config", "user.name", author_info["author_name"]],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.name: {result.stderr}")
-        
-        result = subprocess.run(
-            ["git", "config", "user.email", author_info["author_email"]],
-            cwd=self.work_dir,
-            capture_output=True,
-            text=True,
-            env=env,
-        )
-        
-        if result.returncode != 0:
-            print(f"Warning: Failed to set git user.email: {result.stderr}")
-        else:
-            print(f"Configured git author: {author_info['author_name']} <{author_info['author_email']}>")
-
+        print(f"Configured git author: {author_info['author_name']} <{author_info['author_email']}>")
@@ -1,16 +1,62 @@
 """GitHub App authentication using JWT and installation tokens."""
 
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 import jwt
 import requests
-from dotenv import load_dotenv
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
-from codebot.core.utils import detect_github_api_url
+from codebot.core.utils import backoff_delay, detect_github_api_url, load_env
+
+_TOKEN_MAX_ATTEMPTS = 5
+_MAX_RETRY_DELAY = 60.0
+_RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# Refresh installation tokens this many seconds before GitHub expires them
+_TOKEN_REFRESH_MARGIN = 300
+# App JWTs are valid for 10 minutes; reuse one for 9 to stay clear of its expiry
+_JWT_LIFETIME = 10 * 60
+_JWT_REUSE_SECONDS = 9 * 60
+
+# Installation tokens shared by every GitHubAppAuth instance in the process,
+# keyed by (api_url, app_id, installation_id), so the token fetched while
+# validating the configuration is reused by the instance that runs the tasks.
+# Values are (token, time.monotonic() deadline after which to refresh it).
+_installation_tokens: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+# One lock per cache key serializes refreshes of that installation, so concurrent callers wait for one
+# token request instead of each sending their own, while other installations are never blocked by it
+_installation_token_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+# Only held while looking up or creating a per-key lock, never across a token request
+_installation_token_locks_guard = threading.Lock()
+
+# Bot user IDs never change, so look each one up once per process, keyed by (api_url, bot_name)
+_bot_user_ids: Dict[Tuple[str, str], str] = {}
+
+
+def _get_retry_delay(response: requests.Response) -> Optional[float]:
+    """
+    Get the delay GitHub asks for before retrying a rate-limited request.
+    
+    Args:
+        response: Response from the GitHub API
+        
+    Returns:
+        Delay in seconds, or None if the response does not specify one
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset_at = response.headers.get("X-RateLimit-Reset")
+        if reset_at and reset_at.isdigit():
+            return max(0.0, int(reset_at) - time.time())
+    
+    return None
 
 
 class GitHubAppAuth:
@@ -32,7 +78,8 @@ class GitHubAppAuth:
             installation_id: Installation ID (defaults to GITHUB_APP_INSTALLATION_ID env var)
             api_url: GitHub API URL (auto-detected if not provided)
         """
-        load_dotenv()
+        # .env is read once per process, not on every construction
+        load_env()
         
         app_id_env = os.getenv("GITHUB_APP_ID")
         private_key_path_env = os.getenv("GITHUB_APP_PRIVATE_KEY_PATH")
@@ -58,31 +105,18 @@ class GitHubAppAuth:
             )
         
         original_path = Path(self.private_key_path)
-        key_path = None
-        
-        if original_path.is_absolute():
-            key_path = original_path.resolve()
-            if key_path.exists():
-                pass
-            else:
-                key_path = None
-        
-        if not key_path or not key_path.exists():
-            key_path = (Path.cwd() / original_path).resolve()
-            if not key_path.exists():
-                key_path = None
-        
-        if not key_path or not key_path.exists():
-            filename_only = original_path.name
-            key_path = (Path.cwd() / filename_only).resolve()
-        
-        if not key_path.exists():
-            cwd_files = [f.name for f in Path.cwd().iterdir() if f.is_file() and f.name.endswith('.pem')]
+        
+        # Try the path as given (absolute, or relative to the working directory),
+        # then the bare filename in the working directory
+        candidates = list(dict.fromkeys([Path.cwd() / original_path, Path.cwd() / original_path.name]))
+        key_path = next((candidate.resolve() for candidate in candidates if candidate.exists()), None)
+        
+        if key_path is None:
+            cwd_files = [f.name for f in Path.cwd().glob("*.pem") if f.is_file()]
+            tried = "".join(f"  Tried: {candidate.resolve()}\n" for candidate in candidates)
             raise RuntimeError(
                 f"GitHub App private key file not found.\n"
-                f"  Tried: {original_path.resolve()}\n"
-                f"  Tried: {(Path.cwd() / original_path).resolve()}\n"
-                f"  Tried: {(Path.cwd() / original_path.name).resolve()}\n"
+                f"{tried}"
                 f"  Original path from env: {self.private_key_path}\n"
                 f"  Current working directory: {Path.cwd()}\n"
                 f"  PEM files found in directory: {cwd_files}"
@@ -98,6 +132,12 @@ class GitHubAppAuth:
         except Exception as e:
             raise RuntimeError(f"Failed to read GitHub App private key file {key_path}: {e}")
         
+        # Parse the PEM once so signing a JWT does not decode the key every time
+        try:
+            self._signing_key = load_pem_private_key(self.private_key.encode(), password=None)
+        except Exception as e:
+            raise RuntimeError(f"Failed to load GitHub App private key {key_path}: {e}")
+        
         self.api_url = api_url or detect_github_api_url()
         
         self.bot_name = os.getenv("GITHUB_BOT_NAME")
@@ -107,8 +147,16 @@ class GitHubAppAuth:
             )
         
         self._installation_token: Optional[str] = None
-        self._token_expires_at: float = 0
+        self._token_refresh_at: float = 0
         self._bot_user_id: Optional[str] = None
+        self._jwt: Optional[str] = None
+        self._jwt_refresh_at: float = 0
+        self._auth_headers: Optional[dict] = None
+        self._auth_headers_token: Optional[str] = None
+        
+        # Keep-alive session so repeated API calls reuse the pooled HTTPS connection
+        self._session = requests.Session()
+        self._session.headers["Accept"] = "application/vnd.github.v3+json"
     
     def get_installation_token(self) -> str:
         """
@@ -117,18 +165,66 @@ class GitHubAppAuth:
         Returns:
             Installation access token
         """
-        if self._installation_token and time.time() < (self._token_expires_at - 300):
+        # Compare against the monotonic clock so wall-clock jumps cannot extend a token's life
+        if self._installation_token and time.monotonic() < self._token_refresh_at:
             return self._installation_token
         
+        cache_key = (self.api_url, str(self.app_id), str(self.installation_id))
+        cached = _installation_tokens.get(cache_key)
+        if cached and time.monotonic() < cached[1]:
+            self._installation_token, self._token_refresh_at = cached
+            return self._installation_token
+        
+        with _installation_token_locks_guard:
+            key_lock = _installation_token_locks.setdefault(cache_key, threading.Lock())
+        
+        with key_lock:
+            # Another thread may have refreshed the token while this one waited
+            cached = _installation_tokens.get(cache_key)
+            if cached and time.monotonic() < cached[1]:
+                self._installation_token, self._token_refresh_at = cached
+                return self._installation_token
+            
+            return self._request_installation_token(cache_key)
+    
+    def _request_installation_token(self, cache_key: Tuple[str, str, str]) -> str:
+        """
+        Request a new installation access token from GitHub and cache it.
+        
+        Args:
+            cache_key: Key of the token in the process-wide cache
+            
+        Returns:
+            Installation access token
+        """
         jwt_token = self._generate_jwt()
         
         url = f"{self.api_url}/app/installations/{self.installation_id}/access_tokens"
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        
-        response = requests.post(url, headers=headers, timeout=10)
+        headers = {"Authorization": f"Bearer {jwt_token}"}
+        
+        # Retry transient failures and rate limits with exponential backoff
+        for attempt in range(_TOKEN_MAX_ATTEMPTS):
+            last_attempt = attempt == _TOKEN_MAX_ATTEMPTS - 1
+            try:
+                response = self._session.post(url, headers=headers, timeout=10)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if last_attempt:
+                    raise
+                delay = backoff_delay(attempt)
+                print(f"Warning: Installation token request failed ({e}), retrying in {delay:.1f}s...")
+                time.sleep(delay)
+                continue
+            
+            retry_delay = _get_retry_delay(response)
+            is_rate_limited = response.status_code == 403 and retry_delay is not None
+            if last_attempt or (response.status_code not in _RETRYABLE_STATUS_CODES and not is_rate_limited):
+                break
+            
+            delay = retry_delay if retry_delay is not None else backoff_delay(attempt)
+            if delay > _MAX_RETRY_DELAY:
+                break
+            print(f"Warning: Installation token request returned {response.status_code}, retrying in {delay:.1f}s...")
+            time.sleep(delay)
         
         if response.status_code != 201:
             error_data = response.json() if response.content else {}
@@ -145,45 +241,63 @@ class GitHubAppAuth:
         expires_at_str = token_data.get("expires_at")
         if expires_at_str:
             expires_at = datetime.fromisoformat(expires_at_str.replace("Z", "+00:00"))
-            self._token_expires_at = expires_at.timestamp()
+            expires_in = expires_at.timestamp() - time.time()
         else:
-            self._token_expires_at = time.time() + 3600
+            expires_in = 3600
+        self._token_refresh_at = time.monotonic() + expires_in - _TOKEN_REFRESH_MARGIN
         
+        _installation_tokens[cache_key] = (self._installation_token, self._token_refresh_at)
         return self._installation_token
     
     def _generate_jwt(self) -> str:
         """
-        Generate JWT for GitHub App authentication.
+        Generate JWT for GitHub App authentication, reusing a cached one while valid.
         
         Returns:
             JWT token string
         """
+        # RS256 signing is expensive, so sign once per JWT lifetime
+        if self._jwt and time.monotonic() < self._jwt_refresh_at:
+            return self._jwt
+        
         now = int(time.time())
         
         payload = {
             "iat": now - 60,  # Issued at time (1 minute ago to account for clock skew)
-            "exp": now + (10 * 60),  # Expires in 10 minutes
+            "exp": now + _JWT_LIFETIME,  # Expires in 10 minutes
             "iss": self.app_id,  # Issuer (GitHub App ID)
         }
         
         try:
-            token = jwt.encode(payload, self.private_key, algorithm="RS256")
-            return token
+            token = jwt.encode(payload, self._signing_key, algorithm="RS256")
         except Exception as e:
             raise RuntimeError(f"Failed to generate JWT: {e}")
+        
+        self._jwt = token
+        self._jwt_refresh_at = time.monotonic() + _JWT_REUSE_SECONDS
+        return token
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session for GitHub API calls made on behalf of this app."""
+        return self._session
     
     def get_auth_headers(self) -> dict:
         """
         Get authentication headers for GitHub API requests.
         
         Returns:
-            Dictionary with Authorization header
+            Dictionary with Authorization header. The same dict is returned until the
+            token is refreshed, so callers must not modify it.
         """
         token = self.get_installation_token()
-        return {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        if token != self._auth_headers_token:
+            self._auth_headers = {
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github.v3+json",
+            }
+            self._auth_headers_token = token
+        return self._auth_headers
     
     def get_bot_user_id(self) -> str:
         """
@@ -201,16 +315,19 @@ class GitHubAppAuth:
         if self._bot_user_id:
             return self._bot_user_id
         
+        cache_key = (self.api_url, self.bot_name)
+        cached = _bot_user_ids.get(cache_key)
+        if cached:
+            self._bot_user_id = cached
+            return cached
+        
         token = self.get_installation_token()
         
         url = f"{self.api_url}/users/{self.bot_name}"
-        headers = {
-            "Authorization": f"token {token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        headers = {"Authorization": f"token {token}"}
         
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self._session.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 error_data = response.json() if response.content else {}
@@ -228,6 +345,7 @@ class GitHubAppAuth:
                 raise RuntimeError("Bot user ID not found in API response")
             
             self._bot_user_id = bot_user_id
+            _bot_user_ids[cache_key] = bot_user_id
             return bot_user_id
             
         except requests.RequestException as e:
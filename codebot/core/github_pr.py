@@ -1,14 +1,27 @@
 """GitHub pull request creation."""
 
+import copy
 import re
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 from urllib.parse import urlparse
 
-import requests
-
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.utils import detect_github_api_url, detect_github_info
 
+# Largest page GitHub returns for list endpoints (the default is 30)
+_MAX_PER_PAGE = 100
+
+# Most conditional-GET entries kept per GitHubPR instance; the least recently used are dropped first
+_ETAG_CACHE_SIZE = 256
+
+# Attribution lines added by Claude Code, removed together with their line break
+_ATTRIBUTION_LINE_RE = re.compile(
+    r"^[^\S\n]*Co-Authored-By:.*\n?|^.*🤖 Generated with Claude Code.*\n?",
+    re.MULTILINE,
+)
+
 
 class GitHubPR:
     """Create pull requests on GitHub."""
@@ -25,14 +38,61 @@ class GitHubPR:
             github_app_auth = GitHubAppAuth(api_url=api_url)
         
         self.github_app_auth = github_app_auth
+        # Share the app's keep-alive session so API calls reuse pooled connections
+        self._session = github_app_auth.session
         
         self.default_api_url = api_url or detect_github_api_url()
         self._repo_api_cache = {}
+        # Last response per (API URL, query params) as (ETag, parsed body), for conditional GETs.
+        # The poller shares this instance across threads, so every access holds the lock.
+        self._etag_cache: "OrderedDict[Tuple[str, Any], Tuple[str, Any]]" = OrderedDict()
+        self._etag_cache_lock = threading.Lock()
     
     @property
     def headers(self) -> dict:
         return self.github_app_auth.get_auth_headers()
     
+    def _get_json(self, url: str, params: Optional[dict] = None) -> Tuple[int, Any]:
+        """
+        GET a JSON resource, revalidating the last copy fetched with the same URL and parameters.
+        
+        The stored ETag is sent as If-None-Match. GitHub answers unchanged resources
+        with 304, which does not count against the rate limit, and the stored body is
+        returned instead. Callers get their own copy, so they may modify it freely.
+        
+        Args:
+            url: Full API URL
+            params: Optional query parameters
+            
+        Returns:
+            Tuple of (status code, parsed body or None on failure). A 304 is reported as 200.
+        """
+        headers = self.headers
+        cache_key = (url, tuple(sorted(params.items())) if params else None)
+        with self._etag_cache_lock:
+            cached = self._etag_cache.get(cache_key)
+            if cached:
+                self._etag_cache.move_to_end(cache_key)
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+        
+        response = self._session.get(url, headers=headers, params=params)
+        
+        if response.status_code == 304 and cached:
+            return 200, copy.deepcopy(cached[1])
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_cache_lock:
+                self._etag_cache[cache_key] = (etag, copy.deepcopy(data))
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return 200, data
+    
     def _get_api_url(self, repository_url: str) -> str:
         """
         Get GitHub API URL for the given repository.
@@ -137,10 +197,9 @@ class GitHubPR:
         owner, repo = self.extract_repo_info(repository_url)
         
         repo_key = f"{owner}/{repo}"
-        api_url = self._get_api_url(repository_url)
-        self._repo_api_cache[repo_key] = api_url
+        self._repo_api_cache[repo_key] = self._get_api_url(repository_url)
         
-        url = self._build_api_url(repository_url, f"repos/{owner}/{repo}/pulls")
+        url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls")
         
         data = {
             "title": title,
@@ -154,7 +213,7 @@ class GitHubPR:
         print(f"  To branch: {base_branch}")
         print(f"  Repository: {owner}/{repo}")
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._session.post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             error_data = response.json()
@@ -210,22 +269,7 @@ class GitHubPR:
         Returns:
             Cleaned commit message
         """
-        lines = commit_message.split("\n")
-        cleaned_lines = []
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped == "🤖 Generated with Claude Code" or "🤖 Generated with Claude Code" in stripped:
-                continue
-            if stripped.startswith("Co-Authored-By:"):
-                continue
-            cleaned_lines.append(line)
-        
-        cleaned = "\n".join(cleaned_lines).strip()
-        while cleaned.endswith("\n\n"):
-            cleaned = cleaned[:-1]
-        
-        return cleaned
+        return _ATTRIBUTION_LINE_RE.sub("", commit_message).strip()
     
     def generate_pr_body(
         self, 
@@ -275,8 +319,8 @@ class GitHubPR:
         body_parts.append("---")
         body_parts.append("*This PR was automatically generated by [codebot](https://github.com/ajibigad/codebot) 🤖*")
         
-        full_body = "\n".join(body_parts)
-        return self._clean_commit_message(full_body)
+        # Free-text sections were cleaned above; the template lines carry no attribution
+        return "\n".join(body_parts)
     
     def get_pr_details(self, owner: str, repo: str, pr_number: int) -> dict:
         """
@@ -291,12 +335,12 @@ class GitHubPR:
             PR data from GitHub API
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}")
-        response = requests.get(url, headers=self.headers)
+        status_code, pr_data = self._get_json(url)
         
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to get PR details: {response.status_code}")
+        if status_code != 200:
+            raise RuntimeError(f"Failed to get PR details: {status_code}")
         
-        return response.json()
+        return pr_data
     
     def get_pr_files_changed(self, owner: str, repo: str, pr_number: int) -> str:
         """
@@ -311,12 +355,11 @@ class GitHubPR:
             Formatted string of files changed
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/files")
-        response = requests.get(url, headers=self.headers)
+        status_code, files = self._get_json(url, {"per_page": _MAX_PER_PAGE})
         
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to get PR files: {response.status_code}")
+        if status_code != 200:
+            raise RuntimeError(f"Failed to get PR files: {status_code}")
         
-        files = response.json()
         result = []
         for file in files:
             status = file.get("status", "modified")[0].upper()  # M, A, D, etc.
@@ -344,7 +387,7 @@ class GitHubPR:
             "in_reply_to": comment_id
         }
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._session.post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             raise RuntimeError(f"Failed to post reply: {response.status_code} - {response.text}")
@@ -367,7 +410,7 @@ class GitHubPR:
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/issues/{pr_number}/comments")
         data = {"body": body}
         
-        response = requests.post(url, headers=self.headers, json=data)
+        response = self._session.post(url, headers=self.headers, json=data)
         
         if response.status_code != 201:
             raise RuntimeError(f"Failed to post comment: {response.status_code} - {response.text}")
@@ -396,7 +439,7 @@ class GitHubPR:
             "body": cleaned_body
         }
         
-        response = requests.patch(url, headers=self.headers, json=data)
+        response = self._session.patch(url, headers=self.headers, json=data)
         
         if response.status_code != 200:
             raise RuntimeError(f"Failed to update PR: {response.status_code} - {response.text}")
@@ -417,42 +460,35 @@ class GitHubPR:
             List of comments in the thread, ordered chronologically
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/comments")
-        response = requests.get(url, headers=self.headers)
+        status_code, all_comments = self._get_json(url, {"per_page": _MAX_PER_PAGE})
         
-        if response.status_code != 200:
+        if status_code != 200:
             return []
         
-        all_comments = response.json()
-        
-        thread_comments = []
-        current_id = comment_id
-        
         comment_map = {c["id"]: c for c in all_comments}
         
-        if current_id not in comment_map:
+        if comment_id not in comment_map:
             return []
         
-        current_comment = comment_map[current_id]
-        
-        thread_root_id = current_comment.get("in_reply_to_id")
-        while thread_root_id and thread_root_id in comment_map:
-            current_comment = comment_map[thread_root_id]
-            thread_root_id = current_comment.get("in_reply_to_id")
-        
-        root_id = current_comment["id"]
-        
-        for comment in all_comments:
-            if comment["id"] == root_id:
-                thread_comments.append(comment)
-            elif comment.get("in_reply_to_id") == root_id:
-                thread_comments.append(comment)
-            else:
-                check_id = comment.get("in_reply_to_id")
-                while check_id and check_id in comment_map:
-                    if check_id == root_id:
-                        thread_comments.append(comment)
-                        break
-                    check_id = comment_map[check_id].get("in_reply_to_id")
+        # Resolve each comment's thread root once, sharing the result with every comment on the way
+        root_of = {}
+        
+        def find_root(current_id: int) -> int:
+            path = []
+            while current_id not in root_of:
+                parent_id = comment_map[current_id].get("in_reply_to_id")
+                if not parent_id or parent_id not in comment_map:
+                    root_of[current_id] = current_id
+                    break
+                path.append(current_id)
+                current_id = parent_id
+            root_id = root_of[current_id]
+            for visited_id in path:
+                root_of[visited_id] = root_id
+            return root_id
+        
+        root_id = find_root(comment_id)
+        thread_comments = [c for c in all_comments if find_root(c["id"]) == root_id]
         
         thread_comments.sort(key=lambda c: c["created_at"])
         
@@ -478,15 +514,15 @@ class GitHubPR:
             List of review comments
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/comments")
-        params = {}
+        params = {"per_page": _MAX_PER_PAGE}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        status_code, items = self._get_json(url, params)
         
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to get PR review comments: {response.status_code}")
+        if status_code != 200:
+            raise RuntimeError(f"Failed to get PR review comments: {status_code}")
         
-        return response.json()
+        return items
     
     def get_pr_issue_comments(
         self,
@@ -508,15 +544,15 @@ class GitHubPR:
             List of issue comments
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/issues/{pr_number}/comments")
-        params = {}
+        params = {"per_page": _MAX_PER_PAGE}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        status_code, items = self._get_json(url, params)
         
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to get PR issue comments: {response.status_code}")
+        if status_code != 200:
+            raise RuntimeError(f"Failed to get PR issue comments: {status_code}")
         
-        return response.json()
+        return items
     
     def get_pr_reviews(
         self,
@@ -538,17 +574,17 @@ class GitHubPR:
             List of PR reviews
         """
         url = self._build_api_url_from_owner_repo(owner, repo, f"repos/{owner}/{repo}/pulls/{pr_number}/reviews")
-        params = {}
+        params = {"per_page": _MAX_PER_PAGE}
         if since:
             params["since"] = since
-        response = requests.get(url, headers=self.headers, params=params)
+        status_code, items = self._get_json(url, params)
         
-        if response.status_code != 200:
-            raise RuntimeError(f"Failed to get PR reviews: {response.status_code}")
+        if status_code != 200:
+            raise RuntimeError(f"Failed to get PR reviews: {status_code}")
         
-        return response.json()
+        return items
     
-    def get_pr_state(self, owner: str, repo: str, pr_number: int) -> dict:
+    def get_pr_state(self, owner: str, repo: str, pr_number: int, include_details: bool = False) -> dict:
         """
         Get current PR state (open/closed/merged).
         
@@ -556,14 +592,19 @@ class GitHubPR:
             owner: Repository owner
             repo: Repository name
             pr_number: Pull request number
+            include_details: Also return the full PR data under "details", so callers
+                that need it do not fetch the PR a second time
             
         Returns:
             Dictionary with PR state information (state, merged, etc.)
         """
         pr_details = self.get_pr_details(owner, repo, pr_number)
-        return {
+        pr_state = {
             "state": pr_details.get("state"),  # open, closed
             "merged": pr_details.get("merged", False),
             "merged_at": pr_details.get("merged_at"),
             "closed_at": pr_details.get("closed_at"),
-        }
\ No newline at end of file
+        }
+        if include_details:
+            pr_state["details"] = pr_details
+        return pr_state
\ No newline at end of file
@@ -240,7 +240,12 @@ class Orchestrator:
         
         if self.git_ops.has_uncommitted_changes():
             print("WARNING: Uncommitted changes detected")
-            commit_msg = self.claude_runner.get_commit_message() if self.claude_runner else None
+            commit_msg = None
+            if self.claude_runner:
+                try:
+                    commit_msg = self.git_ops.get_commit_message("HEAD")
+                except RuntimeError:
+                    commit_msg = None
             if commit_msg:
                 print(f"Using commit message from Claude: {commit_msg}")
                 self.git_ops.commit_changes(commit_msg)
@@ -263,28 +268,9 @@ class Orchestrator:
         self.github_pr = GitHubPR(self.github_app_auth)
         
         commit_message = None
-        if self.git_ops:
-            commit_message = self.git_ops.get_latest_commit_hash()
-            if commit_message:
-                result = subprocess.run(
-                    ["git", "log", "-1", "--pretty=format:%B"],
-                    cwd=self.work_dir,
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0:
-                    commit_message = result.stdout.strip()
-        
         files_changed = None
-        if self.git_ops:
-            result = subprocess.run(
-                ["git", "diff", "--name-status", "HEAD~1", "HEAD"],
-                cwd=self.work_dir,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                files_changed = result.stdout.strip()
+        if self.git_ops and self.git_ops.get_latest_commit_hash():
+            commit_message, files_changed = self.git_ops.get_commit_summary()
         
         title = self.github_pr.generate_pr_title(self.task)
         body = self.github_pr.generate_pr_body(
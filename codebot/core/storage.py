@@ -43,6 +43,7 @@ class TaskStorage(ABC):
         result: Optional[dict] = None,
         error: Optional[str] = None,
         subtasks: Optional[List[str]] = None,
+        logs: Optional[List[dict]] = None,
     ) -> None:
         """
         Update task fields.
@@ -55,6 +56,7 @@ class TaskStorage(ABC):
             result: Task result
             error: Error message if failed
             subtasks: List of subtask IDs
+            logs: List of log entries
         """
         pass
     
@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from codebot.core.models import Task, TaskPrompt
 from codebot.core.storage import TaskStorage
+from codebot.core.utils import utc_now
 
 
 class SQLiteTaskStorage(TaskStorage):
@@ -215,6 +216,7 @@ class SQLiteTaskStorage(TaskStorage):
         result: Optional[dict] = None,
         error: Optional[str] = None,
         subtasks: Optional[List[str]] = None,
+        logs: Optional[List[dict]] = None,
     ) -> None:
         """Update task fields."""
         cursor = self.conn.cursor()
@@ -246,6 +248,10 @@ class SQLiteTaskStorage(TaskStorage):
             updates.append("subtasks = ?")
             values.append(json.dumps(subtasks) if subtasks else None)
         
+        if logs is not None:
+            updates.append("logs_json = ?")
+            values.append(json.dumps(logs))
+        
         if not updates:
             return
         
@@ -422,7 +428,7 @@ class SQLiteTaskStorage(TaskStorage):
             repo_name,
             pr_number,
             comment_type,
-            self._serialize_datetime(datetime.utcnow()),
+            self._serialize_datetime(utc_now()),
         ))
         self.conn.commit()
     
@@ -466,7 +472,7 @@ class SQLiteTaskStorage(TaskStorage):
     
     def cleanup_old_processed_comments(self, retention_seconds: int) -> None:
         """Clean up old processed comment records."""
-        cutoff_time = datetime.utcnow() - timedelta(seconds=retention_seconds)
+        cutoff_time = utc_now() - timedelta(seconds=retention_seconds)
         cursor = self.conn.cursor()
         cursor.execute("""
             DELETE FROM processed_comments
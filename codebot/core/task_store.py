@@ -1,5 +1,6 @@
 """Unified task storage for CLI and web-initiated tasks."""
 
+import queue
 import threading
 from datetime import datetime
 from pathlib import Path
@@ -54,12 +55,16 @@ class TaskStore:
         """
         self.storage = storage or _create_storage()
         self.lock = threading.Lock()
+        self._pending_updates: queue.Queue = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
     
     def add_task(self, task: Task) -> None:
         with self.lock:
             self.storage.add_task(task)
     
     def get_task(self, task_id: str) -> Optional[Task]:
+        self.flush()
         with self.lock:
             return self.storage.get_task(task_id)
     
@@ -71,6 +76,7 @@ class TaskStore:
         completed_at: Optional[datetime] = None,
         result: Optional[dict] = None,
         error: Optional[str] = None,
+        logs: Optional[List[dict]] = None,
     ) -> None:
         """
         Update task fields.
@@ -82,7 +88,10 @@ class TaskStore:
             completed_at: When task completed
             result: Task result
             error: Error message if failed
+            logs: List of log entries to persist with the update
         """
+        # Apply queued asynchronous updates first so writes land in order
+        self.flush()
         with self.lock:
             self.storage.update_task(
                 task_id=task_id,
@@ -91,8 +100,67 @@ class TaskStore:
                 completed_at=completed_at,
                 result=result,
                 error=error,
+                logs=logs,
             )
     
+    def update_task_async(
+        self,
+        task_id: str,
+        status: Optional[str] = None,
+        started_at: Optional[datetime] = None,
+        completed_at: Optional[datetime] = None,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Queue a task update to be written by a background thread.
+        
+        Use this for intermediate lifecycle updates that the caller does not
+        need to wait on. Queued updates are written in order, and update_task,
+        flush and every read wait for them, so readers never see stale status.
+        
+        Args:
+            task_id: Task ID
+            status: New status
+            started_at: When task started
+            completed_at: When task completed
+            result: Task result
+            error: Error message if failed
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending_updates,
+                    name="TaskStoreWriter",
+                    daemon=True,
+                )
+                self._writer.start()
+        
+        self._pending_updates.put({
+            "task_id": task_id,
+            "status": status,
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "result": result,
+            "error": error,
+        })
+    
+    def _write_pending_updates(self) -> None:
+        """Writer thread that persists queued updates."""
+        while True:
+            update = self._pending_updates.get()
+            try:
+                with self.lock:
+                    self.storage.update_task(**update)
+            except Exception as e:
+                print(f"Warning: Failed to persist update for task {update['task_id']}: {e}")
+            finally:
+                self._pending_updates.task_done()
+    
+    def flush(self) -> None:
+        """Block until all queued asynchronous updates have been written."""
+        self._pending_updates.join()
+    
     def list_tasks(
         self,
         status_filter: Optional[str] = None,
@@ -110,6 +178,7 @@ class TaskStore:
         Returns:
             List of tasks
         """
+        self.flush()
         with self.lock:
             return self.storage.list_tasks(
                 status_filter=status_filter,
@@ -118,6 +187,7 @@ class TaskStore:
             )
     
     def get_all_tasks(self) -> List[Task]:
+        self.flush()
         with self.lock:
             return self.storage.get_all_tasks()
     
@@ -131,6 +201,7 @@ class TaskStore:
         Returns:
             Task or None if not found
         """
+        self.flush()
         with self.lock:
             return self.storage.find_task_by_branch_uuid(uuid)
     
@@ -144,14 +215,17 @@ class TaskStore:
         Returns:
             Task or None if not found
         """
+        self.flush()
         with self.lock:
             return self.storage.find_task_by_pr_url(pr_url)
     
     def size(self) -> int:
+        self.flush()
         with self.lock:
             return len(self.storage.get_all_tasks())
     
     def close(self) -> None:
+        self.flush()
         with self.lock:
             self.storage.close()
 
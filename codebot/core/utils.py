@@ -1,16 +1,14 @@
 """Utility functions for codebot."""
 
-import hashlib
+import functools
 import os
+import random
 import shutil
-import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
-from codebot.core.task_store import global_task_store
-
 
 def validate_github_app_config(api_url: Optional[str] = None, repository_url: Optional[str] = None, verbose: bool = False) -> Tuple[bool, Optional[str]]:
     """
@@ -205,6 +203,17 @@ def get_codebot_git_author_info(bot_user_id: str, bot_name: Optional[str] = None
     }
 
 
+@functools.lru_cache(maxsize=1)
+def get_git_executable() -> str:
+    """
+    Resolve the git executable once per process.
+    
+    Returns:
+        Absolute path to git, or "git" if it could not be found on PATH
+    """
+    return shutil.which("git") or "git"
+
+
 def get_git_env(bot_user_id: Optional[str] = None, bot_name: Optional[str] = None, api_url: Optional[str] = None) -> Dict[str, str]:
     """
     Get git environment variables for non-interactive operation.
@@ -234,11 +243,68 @@ def get_git_env(bot_user_id: Optional[str] = None, bot_name: Optional[str] = Non
     return env
 
 
+@functools.lru_cache(maxsize=1)
+def load_env() -> Dict[str, str]:
+    """
+    Load the .env file once and snapshot the resulting environment.
+    
+    Later calls return the cached snapshot without re-reading .env. Callers
+    must not mutate the returned dict; use refresh_env_cache() to pick up
+    changes made to .env or os.environ after the first load.
+    
+    Returns:
+        Dictionary of environment variables
+    """
+    # Import here so that modules that never read .env do not load dotenv
+    from dotenv import load_dotenv
+    
+    load_dotenv()
+    return dict(os.environ)
+
+
+def refresh_env_cache() -> Dict[str, str]:
+    """
+    Reload the .env file and rebuild the cached environment snapshot.
+    
+    Returns:
+        Dictionary of environment variables
+    """
+    load_env.cache_clear()
+    return load_env()
+
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """
+    Compute an exponential backoff delay with jitter for a retry attempt.
+    
+    Args:
+        attempt: Zero-based number of the attempt that just failed
+        base_delay: Delay in seconds before the first retry
+        max_delay: Upper bound on the exponential part of the delay
+        
+    Returns:
+        Delay in seconds
+    """
+    return min(max_delay, base_delay * 2 ** attempt) + random.uniform(0, base_delay)
+
+
+def utc_now() -> datetime:
+    """
+    Get the current UTC time as a naive datetime.
+    
+    Task timestamps are stored and compared as naive UTC values, so this keeps
+    that format while avoiding the deprecated datetime.utcnow().
+    
+    Returns:
+        Current UTC time without tzinfo
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 def generate_short_uuid() -> str:
     """Generate a short UUID (7 characters) for use in branch names and directory names."""
-    uuid_str = str(uuid.uuid4())
-    sha256_hash = hashlib.sha256(uuid_str.encode()).hexdigest()
-    return sha256_hash[:7]
+    # Hex-encoding random bytes is already uniform, so there is no need to hash a UUID
+    return os.urandom(4).hex()[:7]
 
 
 def generate_branch_name(
@@ -335,12 +401,12 @@ def find_workspace_by_uuid(base_dir: Path, uuid: str) -> Optional[Path]:
     if not base_dir.exists():
         return None
     
-    # Search for directories matching the pattern
-    for item in base_dir.iterdir():
-        if item.is_dir() and item.name.endswith(f"_{uuid}"):
-            return item
-        elif item.is_dir() and item.name == f"task_{uuid}":
-            return item
+    # Match on the name first; scandir entries answer is_dir() without an extra stat
+    suffix = f"_{uuid}"
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_dir():
+                return Path(entry.path)
     
     return None
 
@@ -395,6 +461,8 @@ def cleanup_pr_workspace(
     Returns:
         Tuple of (success: bool, message: str)
     """
+    from codebot.core.task_store import global_task_store
+    
     # Only clean up workspaces for codebot branches
     if not branch_name.startswith("u/codebot/"):
         return False, "Not a codebot branch"
@@ -416,13 +484,13 @@ def cleanup_pr_workspace(
             global_task_store.update_task(
                 task.id,
                 status="completed",
-                completed_at=datetime.utcnow()
+                completed_at=utc_now()
             )
         else:
             global_task_store.update_task(
                 task.id,
                 status="rejected",
-                completed_at=datetime.utcnow()
+                completed_at=utc_now()
             )
     
     if cleanup_workspace(workspace_path):
@@ -1,10 +1,10 @@
 """REST API endpoints for task submission."""
 
 import uuid
-from datetime import datetime
 from flask import Blueprint, request, jsonify
 
 from codebot.core.models import Task, TaskPrompt
+from codebot.core.utils import utc_now
 from codebot.server.auth import require_api_key
 from codebot.server.task_queue import TaskQueue
 
@@ -71,7 +71,7 @@ def create_api_blueprint(task_queue: TaskQueue) -> Blueprint:
                 id=task_id,
                 prompt=prompt,
                 status="pending",
-                submitted_at=datetime.utcnow(),
+                submitted_at=utc_now(),
                 source="web",
             )
             
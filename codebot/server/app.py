@@ -6,10 +6,6 @@ import threading
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
-
-from codebot.core.github_app import GitHubAppAuth
-from codebot.core.utils import validate_github_app_config
 
 
 @click.command(name="serve")
@@ -109,7 +105,11 @@ def serve(
     - Set CODEBOT_API_KEYS environment variable with comma-separated API keys
     - Use --workers to scale task processing
     """
-    load_dotenv()
+    # Import here so that loading the CLI does not pull in the GitHub App stack
+    from codebot.core.github_app import GitHubAppAuth
+    from codebot.core.utils import load_env, validate_github_app_config
+    
+    load_env()
     
     print("Validating GitHub App configuration...")
     is_valid, error_type = validate_github_app_config(verbose=True)
@@ -2,10 +2,11 @@
 
 import sys
 import threading
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import List, Optional, Dict
 
 from codebot.core.storage import TaskStorage
+from codebot.core.utils import utc_now
 
 
 class LogStorage:
@@ -26,7 +27,7 @@ class LogStorage:
     
     def add_log(self, task_id: str, source: str, message: str) -> None:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utc_now().isoformat(),
             "source": source,
             "message": message
         }
@@ -69,6 +70,16 @@ class LogStorage:
             if task_id in self._logs:
                 del self._logs[task_id]
     
+    def discard_logs(self, task_id: str) -> None:
+        """
+        Drop a task's in-memory logs once they have been persisted elsewhere.
+        
+        Args:
+            task_id: Task ID
+        """
+        with self._lock:
+            self._logs.pop(task_id, None)
+    
     def has_logs(self, task_id: str) -> bool:
         with self._lock:
             return task_id in self._logs and len(self._logs[task_id]) > 0
@@ -83,7 +94,7 @@ class LogStorage:
         if not self.storage or not hasattr(self.storage, 'cleanup_old_logs'):
             return
         
-        cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
+        cutoff_date = utc_now() - timedelta(days=retention_days)
         self.storage.cleanup_old_logs(cutoff_date)
 
 
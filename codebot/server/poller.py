@@ -1,6 +1,7 @@
 """GitHub PR comment poller for environments without webhook access."""
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from queue import Queue
@@ -10,7 +11,7 @@ from urllib.parse import urlparse
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.github_pr import GitHubPR
 from codebot.core.task_store import global_task_store
-from codebot.core.utils import cleanup_pr_workspace
+from codebot.core.utils import cleanup_pr_workspace, utc_now
 
 
 class GitHubPoller:
@@ -42,6 +43,8 @@ class GitHubPoller:
         self.reset_poll_times = reset_poll_times
         self.running = False
         self.bot_login = github_app_auth.get_bot_login()
+        # Fetches a PR's three comment listings in parallel; kept for the poller's lifetime
+        self._executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="GitHubPoller")
     
     def start(self):
         self.running = True
@@ -61,6 +64,7 @@ class GitHubPoller:
     
     def stop(self):
         self.running = False
+        self._executor.shutdown(wait=False, cancel_futures=True)
         print("GitHub poller stopped")
     
     def _poll_once(self):
@@ -95,8 +99,11 @@ class GitHubPoller:
         if not all([repo_owner, repo_name, pr_number]):
             return
         
+        # Fetched once with the state and reused below for the first poll and queued comments
+        pr_details = None
         try:
-            pr_state = self.github_pr.get_pr_state(repo_owner, repo_name, pr_number)
+            pr_state = self.github_pr.get_pr_state(repo_owner, repo_name, pr_number, include_details=True)
+            pr_details = pr_state["details"]
             
             if pr_state["state"] == "closed":
                 merged = pr_state.get("merged", False)
@@ -124,14 +131,14 @@ class GitHubPoller:
                         global_task_store.update_task(
                             task.id,
                             status="completed",
-                            completed_at=datetime.utcnow()
+                            completed_at=utc_now()
                         )
                     else:
                         print(f"PR #{pr_number} closed (not merged), updating task {task.id} to rejected (workspace cleanup skipped - no branch name)")
                         global_task_store.update_task(
                             task.id,
                             status="rejected",
-                            completed_at=datetime.utcnow()
+                            completed_at=utc_now()
                         )
                 
                 return
@@ -155,17 +162,18 @@ class GitHubPoller:
         
         if not last_poll_time:
             try:
-                pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
+                if pr_details is None:
+                    pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
                 created_at = pr_details.get("created_at")
                 if created_at:
                     pr_created = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
                     last_poll_time = pr_created - timedelta(minutes=1)
                     print(f"First poll for PR #{pr_number}, using PR creation time: {pr_created} (since: {last_poll_time})")
                 else:
-                    last_poll_time = datetime.utcnow() - timedelta(days=1)
+                    last_poll_time = utc_now() - timedelta(days=1)
                     print(f"First poll for PR #{pr_number}, PR creation time not found, using 24h ago: {last_poll_time}")
             except Exception as e:
-                last_poll_time = datetime.utcnow() - timedelta(days=1)
+                last_poll_time = utc_now() - timedelta(days=1)
                 print(f"First poll for PR #{pr_number}, error getting PR details: {e}, using 24h ago: {last_poll_time}")
         else:
             original_last_poll = last_poll_time
@@ -183,14 +191,26 @@ class GitHubPoller:
         
         print(f"Polling PR #{pr_number} since {since_timestamp} (last_poll_time: {last_poll_time})")
         
+        # The three listings are independent, so fetch them in parallel over the shared session
+        # and handle each result (or error) in order below
+        review_comments_future = self._executor.submit(
+            self.github_pr.get_pr_review_comments, repo_owner, repo_name, pr_number, since=since_timestamp
+        )
+        issue_comments_future = self._executor.submit(
+            self.github_pr.get_pr_issue_comments, repo_owner, repo_name, pr_number, since=since_timestamp
+        )
+        reviews_future = self._executor.submit(
+            self.github_pr.get_pr_reviews, repo_owner, repo_name, pr_number, since=since_timestamp
+        )
+        
         try:
-            review_comments = self.github_pr.get_pr_review_comments(
-                repo_owner, repo_name, pr_number, since=since_timestamp
-            )
+            review_comments = review_comments_future.result()
             print(f"Found {len(review_comments)} review comment(s) for PR #{pr_number} (since {since_timestamp})")
             for comment in review_comments:
                 if self._should_process_comment(comment, "review_comment"):
-                    self._add_comment_to_queue(comment, task, repo_owner, repo_name, pr_number, "review_comment")
+                    self._add_comment_to_queue(
+                        comment, task, repo_owner, repo_name, pr_number, "review_comment", pr_details
+                    )
                     new_comments_found = True
                 else:
                     comment_id = comment.get("id")
@@ -200,13 +220,13 @@ class GitHubPoller:
             print(f"Warning: Failed to fetch review comments for PR #{pr_number}: {e}")
         
         try:
-            issue_comments = self.github_pr.get_pr_issue_comments(
-                repo_owner, repo_name, pr_number, since=since_timestamp
-            )
+            issue_comments = issue_comments_future.result()
             print(f"Found {len(issue_comments)} issue comment(s) for PR #{pr_number} (since {since_timestamp})")
             for comment in issue_comments:
                 if self._should_process_comment(comment, "issue_comment"):
-                    self._add_comment_to_queue(comment, task, repo_owner, repo_name, pr_number, "issue_comment")
+                    self._add_comment_to_queue(
+                        comment, task, repo_owner, repo_name, pr_number, "issue_comment", pr_details
+                    )
                     new_comments_found = True
                 else:
                     comment_id = comment.get("id")
@@ -216,13 +236,11 @@ class GitHubPoller:
             print(f"Warning: Failed to fetch issue comments for PR #{pr_number}: {e}")
         
         try:
-            reviews = self.github_pr.get_pr_reviews(
-                repo_owner, repo_name, pr_number, since=since_timestamp
-            )
+            reviews = reviews_future.result()
             print(f"Found {len(reviews)} review(s) for PR #{pr_number}")
             for review in reviews:
                 if self._should_process_review(review):
-                    self._add_review_to_queue(review, task, repo_owner, repo_name, pr_number)
+                    self._add_review_to_queue(review, task, repo_owner, repo_name, pr_number, pr_details)
                     new_comments_found = True
                 else:
                     review_id = review.get("id")
@@ -232,7 +250,7 @@ class GitHubPoller:
             print(f"Warning: Failed to fetch reviews for PR #{pr_number}: {e}")
         
         if new_comments_found or not storage.get_last_poll_time(repo_owner, repo_name, pr_number):
-            poll_start_time = datetime.utcnow()
+            poll_start_time = utc_now()
             storage.update_last_poll_time(
                 repo_owner, repo_name, pr_number, poll_start_time
             )
@@ -291,6 +309,7 @@ class GitHubPoller:
         repo_name: str,
         pr_number: int,
         comment_type: str,
+        pr_details: Optional[dict] = None,
     ):
         comment_id = comment.get("id")
         
@@ -300,7 +319,8 @@ class GitHubPoller:
             return
         
         try:
-            pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
+            if pr_details is None:
+                pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
             branch_name = pr_details.get("head", {}).get("ref")
             pr_title = pr_details.get("title", "")
             pr_body = pr_details.get("body", "")
@@ -341,6 +361,7 @@ class GitHubPoller:
         repo_owner: str,
         repo_name: str,
         pr_number: int,
+        pr_details: Optional[dict] = None,
     ):
         review_id = review.get("id")
         comment_type = "review"
@@ -350,7 +371,8 @@ class GitHubPoller:
             return
         
         try:
-            pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
+            if pr_details is None:
+                pr_details = self.github_pr.get_pr_details(repo_owner, repo_name, pr_number)
             branch_name = pr_details.get("head", {}).get("ref")
             pr_title = pr_details.get("title", "")
             pr_body = pr_details.get("body", "")
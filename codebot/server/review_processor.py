@@ -4,7 +4,6 @@ import json
 import subprocess
 import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 from queue import Empty, Queue
 from typing import Optional
@@ -16,7 +15,7 @@ from codebot.core.github_pr import GitHubPR
 from codebot.core.models import Task, TaskPrompt
 from codebot.core.task_store import global_task_store
 from codebot.server.review_runner import ReviewRunner
-from codebot.core.utils import extract_uuid_from_branch, find_workspace_by_uuid
+from codebot.core.utils import extract_uuid_from_branch, find_workspace_by_uuid, utc_now
 
 
 class ReviewProcessor:
@@ -298,6 +297,7 @@ class ReviewProcessor:
         
         # Create review task and link to parent if found
         review_task_id = str(uuid.uuid4())
+        now = utc_now()
         review_task = Task(
             id=review_task_id,
             prompt=TaskPrompt(
@@ -305,9 +305,9 @@ class ReviewProcessor:
                 description=f"Review comment on PR #{pr_number}: {comment_body[:100]}",
             ),
             status="completed",
-            submitted_at=datetime.utcnow(),
+            submitted_at=now,
             source="review",
-            completed_at=datetime.utcnow(),
+            completed_at=now,
             result={
                 "pr_number": pr_number,
                 "pr_url": f"https://github.com/{repo_owner}/{repo_name}/pull/{pr_number}",
@@ -558,9 +558,8 @@ Do not include any other text, markdown, or formatting. Only the JSON object."""
             env_manager.work_dir = workspace_path
             print(f"Created work directory: {workspace_path}")
             
-            env_manager._clone_repository()
+            GitOps.clone_repository(repo_url, workspace_path, self.github_app_auth, branch=branch_name)
             env_manager.branch_name = branch_name
-            env_manager._checkout_branch(branch_name)
             
             return workspace_path
             
@@ -912,16 +911,11 @@ Format example:
         cleaned_lines = []
 
         for line in lines:
-            stripped = line.strip()
-            if stripped == "🤖 Generated with Claude Code" or "🤖 Generated with Claude Code" in stripped:
-                continue
-            if stripped.startswith("Co-Authored-By:"):
+            if line.lstrip().startswith("Co-Authored-By:") or "🤖 Generated with Claude Code" in line:
                 continue
             cleaned_lines.append(line)
 
         cleaned = "\n".join(cleaned_lines).strip()
-        while cleaned.endswith("\n\n"):
-            cleaned = cleaned[:-1]
 
         return cleaned
     
@@ -1,13 +1,13 @@
 """Task processor for HTTP-submitted tasks."""
 
 import threading
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from codebot.core.github_app import GitHubAppAuth
 from codebot.core.orchestrator import Orchestrator
 from codebot.core.task_store import global_task_store
+from codebot.core.utils import utc_now
 from codebot.server.log_capture import LogCapture, get_log_storage
 from codebot.server.task_queue import TaskQueue
 
@@ -95,10 +95,10 @@ class TaskProcessor:
             print(f"ERROR: Task {task_id} not found")
             return
         
-        self.task_queue.update_status(
+        self.task_queue.update_status_async(
             task_id,
             status="running",
-            started_at=datetime.utcnow()
+            started_at=utc_now()
         )
         
         log_storage = get_log_storage(storage=global_task_store.storage)
@@ -122,26 +122,28 @@ class TaskProcessor:
             }
             
             final_status = "pending_review"
-            log_storage.persist_logs(task_id)
             
+            # Persist the logs with the final status in a single write
             self.task_queue.update_status(
                 task_id,
                 status=final_status,
                 completed_at=None,
-                result=result
+                result=result,
+                logs=log_storage.get_logs(task_id) or None,
             )
+            log_storage.discard_logs(task_id)
             
             print(f"Task {task_id} PR created - pending review")
             
         except Exception as e:
             print(f"ERROR: Task {task_id} failed: {e}")
             
-            log_storage.persist_logs(task_id)
-            
             self.task_queue.update_status(
                 task_id,
                 status="failed",
-                completed_at=datetime.utcnow(),
-                error=str(e)
+                completed_at=utc_now(),
+                error=str(e),
+                logs=log_storage.get_logs(task_id) or None,
             )
+            log_storage.discard_logs(task_id)
 
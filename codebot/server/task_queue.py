@@ -51,6 +51,7 @@ class TaskQueue:
         completed_at: Optional[datetime] = None,
         result: Optional[dict] = None,
         error: Optional[str] = None,
+        logs: Optional[List[dict]] = None,
     ) -> None:
         """
         Update task status.
@@ -62,6 +63,7 @@ class TaskQueue:
             completed_at: When task completed
             result: Task result
             error: Error message if failed
+            logs: List of log entries to persist with the status
         """
         self.task_store.update_task(
             task_id=task_id,
@@ -70,6 +72,27 @@ class TaskQueue:
             completed_at=completed_at,
             result=result,
             error=error,
+            logs=logs,
+        )
+    
+    def update_status_async(
+        self,
+        task_id: str,
+        status: str,
+        started_at: Optional[datetime] = None,
+    ) -> None:
+        """
+        Queue a task status update without waiting for it to be written.
+        
+        Args:
+            task_id: Task ID
+            status: New status
+            started_at: When task started
+        """
+        self.task_store.update_task_async(
+            task_id=task_id,
+            status=status,
+            started_at=started_at,
         )
     
     def list_tasks(
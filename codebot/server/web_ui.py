@@ -2,13 +2,13 @@
 
 import json
 import uuid
-from datetime import datetime
 
 import requests
 from flask import Blueprint, Response, render_template, jsonify, request, current_app, stream_with_context
 
 from codebot.core.models import Task, TaskPrompt
 from codebot.core.task_store import global_task_store
+from codebot.core.utils import utc_now
 from codebot.server.auth import require_basic_auth, require_auth
 from codebot.server.log_capture import get_log_storage
 
@@ -138,7 +138,7 @@ def create_web_ui_blueprint() -> Blueprint:
             id=new_task_id,
             prompt=original_task.prompt,
             status="pending",
-            submitted_at=datetime.utcnow(),
+            submitted_at=utc_now(),
             source="web",
         )
         
@@ -272,7 +272,7 @@ def create_web_ui_blueprint() -> Blueprint:
                 id=task_id,
                 prompt=prompt,
                 status="pending",
-                submitted_at=datetime.utcnow(),
+                submitted_at=utc_now(),
                 source="web",
             )
             